@@ -1,30 +1,28 @@
 #!/usr/bin/env python3
 import csv
 from collections import Counter
+from itertools import zip_longest
 
 with open('portfolio_companies_orig.csv', 'r', encoding='utf-8-sig') as f:
-    reader = csv.DictReader(f)
+    reader = csv.reader(f)
+    header = next(reader, [])
 
-    locations = []
-    stages = []
-    sales_models = []
+    # Transpose rows into columns so the counting below runs in Counter's C
+    # loop instead of a per-row dict lookup; short rows are padded with ''
+    columns = dict(zip(header, zip_longest(*reader, fillvalue='')))
 
-    for row in reader:
-        if row.get('Location'):
-            locations.append(row['Location'])
-        if row.get('Stage'):
-            stages.append(row['Stage'])
-        if row.get('Sales Model'):
-            sales_models.append(row['Sales Model'])
+    locations = Counter(filter(None, columns.get('Location', ())))
+    stages = Counter(filter(None, columns.get('Stage', ())))
+    sales_models = Counter(filter(None, columns.get('Sales Model', ())))
 
     print("=== LOCATIONS ===")
-    for loc, count in Counter(locations).most_common(20):
+    for loc, count in locations.most_common(20):
         print(f"{loc}: {count}")
 
     print("\n=== STAGES ===")
-    for stage, count in Counter(stages).most_common():
+    for stage, count in stages.most_common():
         print(f"{stage}: {count}")
 
     print("\n=== SALES MODELS ===")
-    for sm, count in Counter(sales_models).most_common():
+    for sm, count in sales_models.most_common():
         print(f"{sm}: {count}")
@@ -11,62 +11,96 @@ import sys
 import os
 from pathlib import Path
 
-def convert_csv_to_insert(csv_file_path, table_name, output_file_path=None):
+# Rows per multi-row INSERT; kept small so each statement stays under D1's
+# per-statement size limit (same as convert_backup_to_d1.py)
+ROWS_PER_INSERT = 10
+
+def write_insert_statements(reader, columns, table_name, out, rows_per_insert=ROWS_PER_INSERT):
+    """
+    Write multi-row INSERT statements to out as CSV rows are read, with up to
+    rows_per_insert rows per statement. reader yields plain list rows.
+
+    Returns:
+        Number of rows converted
     """
-    Convert CSV file to SQL INSERT statements.
+    # Everything up to the values is the same for every statement
+    columns_str = ', '.join(columns)
+    insert_header = f"INSERT INTO {table_name} ({columns_str}) VALUES\n"
+
+    column_count = len(columns)
+
+    row_count = 0
+    batch = []
+    for row in reader:
+        # DictReader skipped blank lines, treated missing values as NULL and
+        # ignored extra ones; keep that
+        if not row:
+            continue
+
+        # Convert row values to SQL format: escape single quotes and wrap in
+        # quotes for non-NULL values
+        values = ['NULL' if not value else "'" + value.replace("'", "''") + "'" for value in row[:column_count]]
+        values += ['NULL'] * (column_count - len(values))
+
+        batch.append('  (' + ', '.join(values) + ')')
+        row_count += 1
+
+        # Create INSERT statement once the batch is full
+        if len(batch) == rows_per_insert:
+            out.write(insert_header + ',\n'.join(batch) + ';\n')
+            batch = []
+
+    # Remaining rows
+    if batch:
+        out.write(insert_header + ',\n'.join(batch) + ';\n')
+
+    return row_count
+
+def convert_csv_to_insert(csv_file_path, table_name, output_file_path=None, rows_per_insert=ROWS_PER_INSERT):
+    """
+    Convert CSV file to batched SQL INSERT statements.
+
+    Statements are streamed to the output as rows are read, so the row count is
+    written as a trailing comment.
 
     Args:
         csv_file_path: Path to the CSV file
         table_name: Name of the table to insert into
         output_file_path: Optional path for output SQL file
+        rows_per_insert: Maximum number of rows per INSERT statement
+
+    Returns:
+        Number of rows converted
     """
     csv_path = Path(csv_file_path)
 
     # Read the CSV file
     with open(csv_path, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
+        # Plain list rows instead of a dict per row
+        reader = csv.reader(csvfile)
 
         # Get column names from header
-        columns = reader.fieldnames
+        columns = next(reader, None)
         if not columns:
             print(f"Error: No columns found in {csv_file_path}")
             return
 
-        # Generate INSERT statements
-        insert_statements = []
-        for row_num, row in enumerate(reader, start=2):  # Start at 2 because row 1 is header
-            # Convert row values to SQL format
-            values = []
-            for col in columns:
-                value = row[col]
-                if value is None or value == '':
-                    values.append('NULL')
-                else:
-                    # Escape single quotes and wrap in quotes for non-NULL values
-                    escaped_value = value.replace("'", "''")
-                    values.append(f"'{escaped_value}'")
-
-            # Create INSERT statement
-            columns_str = ', '.join(columns)
-            values_str = ', '.join(values)
-            insert_sql = f"INSERT INTO {table_name} ({columns_str}) VALUES ({values_str});"
-            insert_statements.append(insert_sql)
-
-    # Write to output file or stdout
-    if output_file_path:
-        output_path = Path(output_file_path)
-        with open(output_path, 'w', encoding='utf-8') as sql_file:
-            sql_file.write(f"-- Auto-generated INSERT statements from {csv_path.name}\n")
-            sql_file.write(f"-- Converted {len(insert_statements)} rows\n\n")
-            sql_file.write('\n'.join(insert_statements))
-        print(f"Generated {len(insert_statements)} INSERT statements in {output_path}")
-    else:
-        print(f"-- Auto-generated INSERT statements from {csv_path.name}")
-        print(f"-- Converted {len(insert_statements)} rows")
-        print()
-        print('\n'.join(insert_statements))
-
-    return insert_statements
+        # Write to output file or stdout
+        if output_file_path:
+            output_path = Path(output_file_path)
+            with open(output_path, 'w', encoding='utf-8') as sql_file:
+                sql_file.write(f"-- Auto-generated INSERT statements from {csv_path.name}\n\n")
+                row_count = write_insert_statements(reader, columns, table_name, sql_file, rows_per_insert)
+                sql_file.write(f"\n-- Converted {row_count} rows\n")
+            print(f"Generated INSERT statements for {row_count} rows in {output_path}")
+        else:
+            print(f"-- Auto-generated INSERT statements from {csv_path.name}")
+            print()
+            row_count = write_insert_statements(reader, columns, table_name, sys.stdout, rows_per_insert)
+            print()
+            print(f"-- Converted {row_count} rows")
+
+    return row_count
 
 def main():
     if len(sys.argv) < 3: